@@ -4,6 +4,7 @@ Authentication Controller
 from app.Http.Controllers.Controller import Controller
 from app.Models.User import User
 from vendor.Illuminate.Auth.JWT import JWT
+from app.Http.Middleware.AuthMiddleware import authenticate
 from starlette.responses import JSONResponse, RedirectResponse
 
 
@@ -12,7 +13,7 @@ class AuthController(Controller):
     
     def show_login(self, request):
         """Show login form"""
-        if getattr(request.state, 'authenticated', False):
+        if authenticate(request):
             return RedirectResponse(url='/dashboard', status_code=302)
         
         redirect_to = request.query_params.get('redirect', '/dashboard')
@@ -20,7 +21,7 @@ class AuthController(Controller):
     
     def show_register(self, request):
         """Show registration form"""
-        if getattr(request.state, 'authenticated', False):
+        if authenticate(request):
             return RedirectResponse(url='/dashboard', status_code=302)
         
         return self.view('auth.register', request)
@@ -82,14 +83,7 @@ class AuthController(Controller):
     async def login(self, request):
         """Handle user login"""
         try:
-            # Get form data from cache (set by MethodOverrideMiddleware)
-            # or read fresh if not cached
-            if hasattr(request.state, '_cached_form'):
-                form = request.state._cached_form
-                print(f"DEBUG: Using cached form data: {dict(form)}")
-            else:
-                form = await request.form()
-                print(f"DEBUG: Form data read fresh: {dict(form)}")
+            form = await request.form()
             
             email = form.get('email', '').strip().lower()
             password = form.get('password', '')
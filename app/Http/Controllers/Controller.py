@@ -1,5 +1,7 @@
 from vendor.Illuminate.Support.Facades.View import View
 from fastapi.responses import RedirectResponse
+from vendor.Illuminate.Support.Facades.Response import JsonResponse
+from vendor.Illuminate.Support.Deferred import Deferred
 
 class Controller:
     def view(self, template: str, request, context: dict = None):
@@ -11,6 +13,14 @@ class Controller:
         """Laravel-style redirect helper"""
         return RedirectResponse(url=url, status_code=status_code)
 
+    def json(self, data, status_code: int = 200, headers: dict = None):
+        """JSON response via orjson; models and lists of models are serialized in bulk"""
+        return JsonResponse(content=data, status_code=status_code, headers=headers)
+
+    def defer(self, fn, *args, **kwargs):
+        """Run fn(*args, **kwargs) after the response is sent (logged and retried on failure)"""
+        Deferred.push(fn, *args, **kwargs)
+
     async def request(self, request):
         """Auto detect request JSON/Form dan ignore _method."""
         content_type = request.headers.get("content-type", "")
@@ -5,6 +5,9 @@ from app.Http.Controllers.Controller import Controller
 from app.Http.Middleware.AuthMiddleware import require_auth, get_current_user
 from app.Models.Post import Post
 from app.Models.User import User
+from app.Models.PostStats import PostStats
+from vendor.Illuminate.Support.Facades.DB import DB
+from vendor.Illuminate.Routing.Admission import Admission
 
 
 class DashboardController(Controller):
@@ -21,27 +24,40 @@ class DashboardController(Controller):
                 print("ERROR: User not found!")
                 return self.redirect('/login')
             
-            # Get user's posts (handle if table doesn't exist)
-            try:
-                posts = await Post.where('user_id', user.id).get()
-                print(f"DEBUG Dashboard: Found {len(posts)} posts")
-            except Exception as e:
-                print(f"WARNING: Could not fetch posts: {e}")
+            # Latest posts and (for admins) site-wide stats from the post_stats
+            # rollup are independent - run them concurrently
+            queries = [Post.by_user(user.id).limit(5)]
+            if user.is_admin():
+                queries.append(PostStats.per_status())
+            
+            results = await DB.gather(*queries, return_exceptions=True)
+            
+            posts = results[0]
+            if isinstance(posts, Exception):
+                print(f"WARNING: Could not fetch posts: {posts}")
                 posts = []
+            else:
+                print(f"DEBUG Dashboard: Found {len(posts)} posts")
             
-            # Get stats
-            total_posts = len(posts)
-            published_posts = len([p for p in posts if hasattr(p, 'status') and p.status == 'published'])
-            draft_posts = len([p for p in posts if hasattr(p, 'status') and p.status == 'draft'])
+            site_stats = results[1] if len(results) > 1 else []
+            if isinstance(site_stats, Exception):
+                print(f"WARNING: Could not read post_stats rollup: {site_stats}")
+                site_stats = []
+            
+            # Get stats from counter cache columns (see Post.counter_caches)
+            total_posts = getattr(user, 'posts_count', 0)
+            published_posts = getattr(user, 'published_posts_count', 0)
+            draft_posts = getattr(user, 'draft_posts_count', 0)
             
             return self.view('dashboard.index', request, {
                 'user': user,
-                'posts': posts[:5],  # Show last 5 posts
+                'posts': posts,  # Show last 5 posts
                 'stats': {
                     'total_posts': total_posts,
                     'published': published_posts,
                     'drafts': draft_posts
-                }
+                },
+                'site_stats': site_stats
             })
         except Exception as e:
             print(f"ERROR Dashboard: {e}")
@@ -57,3 +73,7 @@ class DashboardController(Controller):
                 },
                 'error': str(e)
             })
+    
+    def admission(self, request):
+        """Admission control metrics: in-flight, queue depth and rejections per limiter"""
+        return self.json(Admission.metrics())
@@ -5,7 +5,9 @@ from app.Http.Controllers.Controller import Controller
 from app.Http.Middleware.AuthMiddleware import require_auth, get_current_user
 from app.Models.Post import Post
 from vendor.Illuminate.Filesystem.Storage import Storage
-from starlette.responses import RedirectResponse
+from vendor.Illuminate.Database.Export import Export
+from vendor.Illuminate.Database.BulkImport import BulkImport
+from starlette.responses import RedirectResponse, StreamingResponse
 import os
 from datetime import datetime
 
@@ -18,6 +20,10 @@ class PostController(Controller):
         """List all posts for current user"""
         user = await get_current_user(request)
         posts = await Post.by_user(user.id).get()
+        Post.view_counter.merge(posts)
+        
+        if 'application/json' in request.headers.get('accept', ''):
+            return self.json({'posts': posts})
         
         return self.view('posts.index', request, {
             'user': user,
@@ -105,6 +111,71 @@ class PostController(Controller):
                 'error': f'Failed to create post: {str(e)}'
             })
     
+    @require_auth
+    async def export(self, request):
+        """
+        Stream posts as CSV or JSONL (?format=csv|jsonl, ?gzip=1)
+        
+        Admins can export every user's posts with ?all=1.
+        """
+        user = await get_current_user(request)
+        format = request.query_params.get('format', 'csv')
+        gzip = request.query_params.get('gzip') in ('1', 'true')
+        
+        if format not in Export.FORMATS:
+            return RedirectResponse(url='/posts', status_code=302)
+        
+        if user.is_admin() and request.query_params.get('all') in ('1', 'true'):
+            query = Post.query().order_by('id')
+        else:
+            query = Post.where('user_id', user.id).order_by('id')
+        
+        filename = Export.filename(f"posts-{datetime.now():%Y%m%d-%H%M%S}", format, gzip)
+        return StreamingResponse(
+            Export.stream(query.cursor(), format, gzip),
+            media_type=Export.media_type(format, gzip),
+            headers={'Content-Disposition': f'attachment; filename="{filename}"'}
+        )
+    
+    @require_auth
+    async def import_posts(self, request):
+        """
+        Bulk import posts from CSV or JSONL
+        
+        Accepts a multipart upload (field `file`) or the raw request body
+        sent as text/csv or application/x-ndjson; either way the body is
+        streamed and records are parsed as they arrive. Admins may set user_id per record, everyone
+        else imports as themselves.
+        """
+        user = await get_current_user(request)
+        content_type = request.headers.get('content-type', '')
+        format = request.query_params.get('format')
+        
+        if content_type.startswith('multipart/form-data'):
+            try:
+                upload = BulkImport.from_multipart(request.stream(), content_type, 'file')
+                found = await upload.open()
+            except ValueError as e:
+                return self.json({'error': str(e)}, status_code=400)
+            if not found or not upload.filename:
+                return self.json({'error': 'No file uploaded'}, status_code=422)
+            format = format or BulkImport.format_for(upload.filename, upload.content_type)
+            chunks = upload.chunks()
+        else:
+            format = format or BulkImport.format_for(None, content_type)
+            chunks = request.stream()
+        
+        if format not in BulkImport.FORMATS:
+            return self.json({'error': 'Upload a .csv or .jsonl file'}, status_code=415)
+        
+        if user.is_admin():
+            importer = BulkImport(Post, defaults={'user_id': user.id})
+        else:
+            importer = BulkImport(Post, overrides={'user_id': user.id})
+        
+        result = await importer.run(BulkImport.records(chunks, format))
+        return self.json(result.to_dict(), status_code=200 if result.inserted or not result.failed else 422)
+    
     @require_auth
     async def show(self, request, post_id: int):
         """Show single post"""
@@ -118,6 +189,9 @@ class PostController(Controller):
         if post.user_id != user.id:
             return RedirectResponse(url='/posts', status_code=302)
         
+        post.record_view()
+        Post.view_counter.merge([post])
+        
         return self.view('posts.show', request, {
             'user': user,
             'post': post
@@ -163,20 +237,15 @@ class PostController(Controller):
                 })
             
             # Handle featured image upload
+            old_image = None
             if featured_image_file and hasattr(featured_image_file, 'filename') and featured_image_file.filename:
-                # Delete old image
-                if post.featured_image:
-                    try:
-                        Storage.delete(post.featured_image)
-                    except:
-                        pass
-                
-                # Upload new image
+                old_image = post.featured_image
                 ext = os.path.splitext(featured_image_file.filename)[1]
                 timestamp = datetime.now().strftime('%Y%m%d%H%M%S')
                 filename = f"post_{timestamp}{ext}"
                 path = f"posts/{filename}"
                 
+                # Upload new image (the old one is deleted once the post points at this one)
                 file_content = await featured_image_file.read()
                 Storage.put(path, file_content)
                 post.featured_image = path
@@ -193,6 +262,10 @@ class PostController(Controller):
             
             await post.save()
             
+            # Delete the replaced image after the redirect is sent
+            if old_image and old_image != post.featured_image:
+                self.defer(Storage.delete, old_image)
+            
             return RedirectResponse(url='/posts', status_code=302)
             
         except Exception as e:
@@ -211,12 +284,9 @@ class PostController(Controller):
         if not post or post.user_id != user.id:
             return RedirectResponse(url='/posts', status_code=302)
         
-        # Delete featured image if exists
+        # Delete featured image after the redirect is sent
         if post.featured_image:
-            try:
-                Storage.delete(post.featured_image)
-            except:
-                pass
+            self.defer(Storage.delete, post.featured_image)
         
         # Delete post
         await post.delete()
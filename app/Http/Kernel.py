@@ -0,0 +1,21 @@
+"""
+HTTP Kernel
+"""
+from app.Http.Middleware.Authenticate import Authenticate
+from app.Http.Middleware.RequireRole import RequireRole
+
+
+class Kernel:
+    """
+    Route middleware aliases, registered by RouteServiceProvider
+    before the routes are loaded
+    
+    Values are Middleware classes, async callables
+    `fn(request, next, *params)` or other aliases with parameters.
+    """
+    
+    route_middleware = {
+        'auth': Authenticate,
+        'role': RequireRole,
+        'admin': 'role:admin',
+    }
@@ -1,40 +1,45 @@
 """
 Authentication Middleware
 """
-from starlette.middleware.base import BaseHTTPMiddleware
+from typing import Optional
 from starlette.responses import JSONResponse, RedirectResponse
 from vendor.Illuminate.Auth.JWT import JWT
 from app.Models.User import User
 
 
-class AuthMiddleware(BaseHTTPMiddleware):
-    """
-    Authentication middleware
-    Protects routes that require authentication
+def authenticate(request) -> Optional[dict]:
     """
+    The request's token payload (None for guests), decoded once per request
     
-    async def dispatch(self, request, call_next):
-        # Get token from cookie or header
-        token = request.cookies.get('auth_token')
-        
-        if not token:
-            # Try Authorization header
-            auth_header = request.headers.get('Authorization')
-            token = JWT.extract_from_header(auth_header)
-        
-        # Decode token
+    Only the 'auth' route middleware (Authenticate), require_auth,
+    require_role, get_current_user and pages that must know (login form
+    redirecting signed-in users, the layout's navbar) call this; there is
+    no global auth middleware, so static files and cached pages never
+    decode a token.
+    """
+    state = request.state
+    if not hasattr(state, 'authenticated'):
+        token = request.cookies.get('auth_token') or JWT.extract_from_header(request.headers.get('authorization'))
         payload = JWT.decode(token) if token else None
-        
-        # Attach user info to request state
-        if payload:
-            request.state.user = payload
-            request.state.authenticated = True
-        else:
-            request.state.user = None
-            request.state.authenticated = False
-        
-        response = await call_next(request)
-        return response
+        state.user = payload
+        state.authenticated = payload is not None
+    return state.user
+
+
+def auth_user(request) -> Optional[dict]:
+    """
+    Template helper: the payload if this request was already authenticated
+    (routes with 'auth', or signed_in() was called), otherwise None
+    """
+    return getattr(request.state, 'user', None)
+
+
+def signed_in(request) -> bool:
+    """
+    Template helper: whether the request carries a valid token (decoded
+    at most once per request, so an expired or forged cookie is a guest)
+    """
+    return authenticate(request) is not None
 
 
 def require_auth(func):
@@ -43,7 +48,7 @@ def require_auth(func):
     Usage: @require_auth
     """
     async def wrapper(self, request, *args, **kwargs):
-        if not getattr(request.state, 'authenticated', False):
+        if authenticate(request) is None:
             # Check if it's an API request
             if request.url.path.startswith('/api/'):
                 return JSONResponse(
@@ -65,7 +70,7 @@ def require_role(role: str):
     """
     def decorator(func):
         async def wrapper(self, request, *args, **kwargs):
-            if not getattr(request.state, 'authenticated', False):
+            if authenticate(request) is None:
                 if request.url.path.startswith('/api/'):
                     return JSONResponse(
                         {'error': 'Unauthorized', 'message': 'Authentication required'},
@@ -93,10 +98,11 @@ def require_role(role: str):
 
 async def get_current_user(request):
     """Helper function to get current authenticated user"""
-    if not getattr(request.state, 'authenticated', False):
+    payload = authenticate(request)
+    if payload is None:
         return None
     
-    user_id = request.state.user.get('user_id')
+    user_id = payload.get('user_id')
     if not user_id:
         return None
     
@@ -0,0 +1,25 @@
+"""
+Authenticate Middleware
+"""
+from starlette.responses import JSONResponse, RedirectResponse
+from vendor.Illuminate.Routing.Middleware import Middleware
+from app.Http.Middleware.AuthMiddleware import authenticate
+
+
+class Authenticate(Middleware):
+    """
+    Route middleware ('auth')
+    Decodes the token (request.state.user / .authenticated) and rejects
+    guests: 401 for /api/ requests, redirect to login otherwise
+    """
+    
+    async def handle(self, request, next, *params):
+        if authenticate(request) is None:
+            if request.url.path.startswith('/api/'):
+                return JSONResponse(
+                    {'error': 'Unauthorized', 'message': 'Authentication required'},
+                    status_code=401
+                )
+            return RedirectResponse(url=f'/login?redirect={request.url.path}', status_code=302)
+        
+        return await next(request)
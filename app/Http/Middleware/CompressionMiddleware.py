@@ -0,0 +1,121 @@
+"""
+Compression Middleware
+"""
+from vendor.Illuminate.Support.Compression import Compression
+
+
+class CompressionMiddleware:
+    """
+    gzip / brotli response compression (pure ASGI)
+
+    The encoding is negotiated from Accept-Encoding (brotli first when the
+    brotli package is installed). Complete bodies smaller than min_size
+    go out as they are; streamed bodies (StreamingResponse, FileResponse)
+    are compressed chunk by chunk and flushed as they arrive, so exports
+    keep streaming. Responses that already have a Content-Encoding
+    (precompressed static files), non-compressible media types (images,
+    archives, PDFs from storage) and `Cache-Control: no-transform` pass
+    through untouched.
+
+    A strong ETag is made weak on compressed responses, since it
+    describes the uncompressed bytes.
+    """
+
+    def __init__(self, app, min_size: int = 1024, gzip_level: int = 6, brotli_quality: int = 4):
+        self.app = app
+        self.min_size = min_size
+        self.levels = {'gzip': gzip_level, 'br': brotli_quality}
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http' or scope['method'] == 'HEAD':
+            return await self.app(scope, receive, send)
+
+        accept = None
+        for name, value in scope['headers']:
+            if name == b'accept-encoding':
+                accept = value.decode('latin-1')
+                break
+        encoding = Compression.negotiate(accept)
+        if encoding is None:
+            return await self.app(scope, receive, send)
+
+        state = {'start': None, 'encoder': None, 'passthrough': False}
+
+        async def compress_send(message):
+            if message['type'] == 'http.response.start':
+                if self._eligible(message):
+                    state['start'] = message
+                else:
+                    state['passthrough'] = True
+                    await send(message)
+                return
+
+            if message['type'] != 'http.response.body' or state['passthrough']:
+                return await send(message)
+
+            body = message.get('body', b'')
+            more_body = message.get('more_body', False)
+            start = state['start']
+
+            if state['encoder'] is None:
+                headers = dict(start['headers'])
+                length = headers.get(b'content-length')
+                size = int(length) if length and length.isdigit() else None
+                # Complete body (or a stream of known small length) below the threshold
+                if (not more_body and len(body) < self.min_size) or (size is not None and size < self.min_size):
+                    state['passthrough'] = True
+                    await send(start)
+                    return await send(message)
+
+                state['encoder'] = Compression.encoder(encoding, self.levels[encoding])
+                start['headers'] = self._headers(start['headers'], encoding)
+                if not more_body:
+                    data = state['encoder'].compress(body) + state['encoder'].finish()
+                    start['headers'].append((b'content-length', str(len(data)).encode('latin-1')))
+                    await send(start)
+                    return await send({'type': 'http.response.body', 'body': data})
+                await send(start)
+
+            encoder = state['encoder']
+            if more_body:
+                data = encoder.compress(body, flush=True) if body else b''
+                if data:
+                    await send({'type': 'http.response.body', 'body': data, 'more_body': True})
+            else:
+                await send({'type': 'http.response.body', 'body': encoder.compress(body) + encoder.finish()})
+
+        await self.app(scope, receive, compress_send)
+
+    @staticmethod
+    def _eligible(start) -> bool:
+        if start['status'] < 200 or start['status'] in (204, 206, 304):
+            return False
+        content_type = None
+        for name, value in start['headers']:
+            if name == b'content-encoding':
+                return False
+            if name == b'content-type':
+                content_type = value.decode('latin-1')
+            elif name == b'cache-control' and b'no-transform' in value.lower():
+                return False
+        return Compression.compressible(content_type)
+
+    @staticmethod
+    def _headers(headers, encoding: str) -> list:
+        """Response headers for the compressed body (length set once it is known)"""
+        result, vary = [], None
+        for name, value in headers:
+            if name == b'content-length':
+                continue
+            if name == b'etag' and not value.startswith(b'W/'):
+                value = b'W/' + value
+            if name == b'vary':
+                vary = value
+                continue
+            result.append((name, value))
+        if vary is None:
+            vary = b'Accept-Encoding'
+        elif b'accept-encoding' not in vary.lower() and vary.strip() != b'*':
+            vary = vary + b', Accept-Encoding'
+        result += [(b'content-encoding', encoding.encode('latin-1')), (b'vary', vary)]
+        return result
@@ -1,21 +1,81 @@
-from starlette.middleware.base import BaseHTTPMiddleware
-from fastapi import Request
-
-class MethodOverrideMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        if request.method == "POST":
-            try:
-                # Read form data and CACHE it in request.state
-                form = await request.form()
-                
-                # Cache form data so controller can access it
-                request.state._cached_form = form
-                
-                # hanya override jika ada _method dan nilainya valid
-                if "_method" in form:
-                    method_override = form["_method"].upper()
-                    if method_override in ("PUT", "DELETE", "PATCH"):
-                        request.scope["method"] = method_override
-            except Exception:
-                pass
-        return await call_next(request)
+"""
+Method Override Middleware
+"""
+from urllib.parse import parse_qsl
+
+
+class MethodOverrideMiddleware:
+    """
+    HTML form method spoofing (pure ASGI)
+
+    A POST becomes PUT, PATCH or DELETE when it carries, in this order:
+      - an X-HTTP-Method-Override header
+      - a ?_method= query parameter
+      - a _method field in a small application/x-www-form-urlencoded body
+
+    Only urlencoded bodies with a Content-Length up to MAX_PEEK bytes are
+    read; the received messages are then replayed unchanged to the app.
+    Multipart uploads and every other body stream through untouched, so
+    use the header or the query parameter for them.
+    """
+
+    METHODS = {'PUT', 'PATCH', 'DELETE'}
+    MAX_PEEK = 16 * 1024
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http' or scope['method'] != 'POST':
+            return await self.app(scope, receive, send)
+
+        headers = dict(scope['headers'])
+        method = self._method(headers.get(b'x-http-method-override', b'').decode('latin-1'))
+        if not method and b'_method=' in scope.get('query_string', b''):
+            method = self._method(self._field(scope['query_string']))
+
+        if not method and self._peekable(headers):
+            messages = []
+            more_body = True
+            while more_body:
+                message = await receive()
+                messages.append(message)
+                more_body = message['type'] == 'http.request' and message.get('more_body', False)
+
+            body = messages[0].get('body', b'') if len(messages) == 1 else b''.join(m.get('body', b'') for m in messages)
+            if b'_method=' in body:
+                method = self._method(self._field(body))
+            receive = self._replay(messages, receive)
+
+        if method:
+            scope['method'] = method
+        await self.app(scope, receive, send)
+
+    def _peekable(self, headers) -> bool:
+        content_type = headers.get(b'content-type', b'').split(b';')[0].strip().lower()
+        if content_type != b'application/x-www-form-urlencoded':
+            return False
+        try:
+            return int(headers.get(b'content-length', b'')) <= self.MAX_PEEK
+        except ValueError:
+            return False
+
+    def _method(self, value) -> str:
+        value = (value or '').strip().upper()
+        return value if value in self.METHODS else ''
+
+    @staticmethod
+    def _field(data: bytes) -> str:
+        for key, value in parse_qsl(data.decode('latin-1')):
+            if key == '_method':
+                return value
+        return ''
+
+    @staticmethod
+    def _replay(messages, receive):
+        """receive() handing out the peeked messages first"""
+        async def replay():
+            if messages:
+                return messages.pop(0)
+            return await receive()
+        return replay
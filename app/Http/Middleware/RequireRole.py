@@ -0,0 +1,23 @@
+"""
+Require Role Middleware
+"""
+from starlette.responses import JSONResponse
+from vendor.Illuminate.Routing.Middleware import Middleware
+from app.Http.Middleware.AuthMiddleware import authenticate
+
+
+class RequireRole(Middleware):
+    """
+    Route middleware ('role:admin' or 'role:admin,editor')
+    Allows users having one of the given roles, 403 otherwise
+    """
+    
+    async def handle(self, request, next, *roles):
+        user = authenticate(request) or {}
+        if user.get('role', 'user') not in roles:
+            return JSONResponse(
+                {'error': 'Forbidden', 'message': f"Requires {' or '.join(roles)} role"},
+                status_code=403
+            )
+        
+        return await next(request)
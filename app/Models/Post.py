@@ -2,6 +2,11 @@
 Post Model
 """
 from vendor.Illuminate.Database.Model import Model
+from vendor.Illuminate.Database.CounterCache import CounterCache
+from vendor.Illuminate.Database.WriteBehindCounter import WriteBehindCounter
+from vendor.Illuminate.Database.Partitioning import Partitioning
+from vendor.Illuminate.Database.Sharding import Sharding
+from vendor.Illuminate.View.Markdown import Markdown
 from datetime import datetime
 import re
 
@@ -19,9 +24,27 @@ class Post(Model):
         "excerpt",
         "featured_image",
         "status",
-        "published_at"
+        "published_at",
+        "content_html",
+        "content_html_version"
     ]
     
+    # Maintained on users by create/save/delete (rebuild: artisan db:recount)
+    counter_caches = [
+        CounterCache('users', 'posts_count', foreign_key='user_id'),
+        CounterCache('users', 'published_posts_count', foreign_key='user_id', where={'status': 'published'}),
+        CounterCache('users', 'draft_posts_count', foreign_key='user_id', where={'status': 'draft'}),
+    ]
+    
+    # Page views, buffered in memory and flushed in batches
+    view_counter = WriteBehindCounter('posts', 'views')
+    
+    # Monthly partitions by created_at (maintain: artisan partition:maintain)
+    partitioning = Partitioning('created_at', interval='month', premake=3)
+    
+    # Colocated with the author's users row on one shard (DB_SHARDS)
+    shard_key = 'user_id'
+    
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
     
@@ -52,7 +75,9 @@ class Post(Model):
             'content': content,
             'excerpt': kwargs.get('excerpt', content[:200] if content else ''),
             'featured_image': kwargs.get('featured_image'),
-            'status': kwargs.get('status', 'draft')
+            'status': kwargs.get('status', 'draft'),
+            'content_html': Markdown.render(content),
+            'content_html_version': Markdown.VERSION
         }
         
         if kwargs.get('status') == 'published' and not kwargs.get('published_at'):
@@ -60,25 +85,121 @@ class Post(Model):
         
         return await cls.create(data)
     
+    @classmethod
+    def prepare_import(cls, row: dict) -> dict:
+        """
+        Validate and normalize one imported record (BulkImport), raises ValueError
+        
+        featured_image is never imported: a path from the file could point at
+        another user's storage object, which destroy() would then delete.
+        """
+        title = str(row.get('title') or '').strip()
+        if not title:
+            raise ValueError('Title is required')
+        if len(title) > 500:
+            raise ValueError('Title is longer than 500 characters')
+        
+        status = str(row.get('status') or 'draft').strip().lower()
+        if status not in ('draft', 'published'):
+            raise ValueError(f"Invalid status: {status}")
+        
+        if row.get('user_id') in (None, ''):
+            raise ValueError('user_id is required')
+        user_id = int(row['user_id'])
+        
+        content = str(row.get('content') or '')
+        published_at = row.get('published_at') or None
+        if isinstance(published_at, str):
+            published_at = datetime.fromisoformat(published_at.replace('Z', '+00:00'))
+        if status == 'published' and not published_at:
+            published_at = datetime.now()
+        
+        return {
+            'user_id': user_id,
+            'title': title,
+            'slug': cls.generate_slug(str(row.get('slug') or title)) or 'post',
+            'content': content,
+            'excerpt': str(row.get('excerpt') or content[:200]),
+            'status': status,
+            'published_at': published_at,
+            'content_html': Markdown.render(content),
+            'content_html_version': Markdown.VERSION,
+        }
+    
+    @classmethod
+    async def prepare_import_batch(cls, rows: list) -> list:
+        """
+        Check authors and allocate unique slugs for a batch of imported records
+        
+        One lookup for the batch's users and one per shard for the slugs
+        already taken, instead of a query per row. Returns an error (or None)
+        per row.
+        """
+        from app.Models.User import User
+        
+        users = await User.find_many(list({row['user_id'] for row in rows}))
+        errors = [None if row['user_id'] in users else f"User {row['user_id']} not found" for row in rows]
+        
+        bases = {row['slug'] for row in rows}
+        patterns = [base.replace('_', '\\_') + '-%' for base in bases]
+        query = f"SELECT slug FROM {cls.table} WHERE slug = ANY(%s) OR slug LIKE ANY(%s)"
+        
+        async def taken_on(shard):
+            conn = await cls.connection(shard)
+            cursor = conn.cursor()
+            try:
+                await cls._execute(conn, cursor, query, (list(bases), patterns))
+                return {slug for (slug,) in cursor.fetchall()}
+            finally:
+                cursor.close()
+                conn.close()
+        
+        taken = set().union(*await Sharding.fan_out(Sharding.targets(cls), taken_on))
+        
+        # Same scheme as create_post: slug, slug-1, slug-2, ...
+        for row in rows:
+            slug, counter = row['slug'], 1
+            while slug in taken:
+                slug = f"{row['slug']}-{counter}"
+                counter += 1
+            row['slug'] = slug
+            taken.add(slug)
+        return errors
+    
     async def author(self):
         """Get the author of this post"""
         from app.Models.User import User
-        return await User.find(self.user_id)
+        return await self.belongs_to(User, 'user_id')
     
     @classmethod
-    async def published(cls):
+    def published(cls):
         """Get only published posts"""
-        return await cls.where('status', 'published').order_by('published_at', 'desc')
+        return cls.where('status', 'published').order_by('published_at', 'desc')
     
     @classmethod
-    async def drafts(cls):
+    def drafts(cls):
         """Get only draft posts"""
-        return await cls.where('status', 'draft').order_by('created_at', 'desc')
+        return cls.where('status', 'draft').order_by('created_at', 'desc')
     
     @classmethod
-    async def by_user(cls, user_id: int):
+    def by_user(cls, user_id: int):
         """Get posts by specific user"""
-        return await cls.where('user_id', user_id).order_by('created_at', 'desc')
+        return cls.where('user_id', user_id).order_by('created_at', 'desc')
+    
+    def render_content(self):
+        """Render content into the content_html cache (see Markdown.VERSION)"""
+        self.content_html = Markdown.render(getattr(self, 'content', None))
+        self.content_html_version = Markdown.VERSION
+    
+    async def save(self) -> bool:
+        """Save, refreshing content_html so views never render Markdown"""
+        if hasattr(self, 'content'):
+            self.render_content()
+        return await super().save()
+    
+    def record_view(self):
+        """Count a page view (write-behind, see view_counter)"""
+        self.view_counter.increment(self.id)
     
     def is_published(self) -> bool:
         """Check if post is published"""
@@ -0,0 +1,39 @@
+"""
+PostStats Rollup
+"""
+from vendor.Illuminate.Database.Rollup import Rollup
+
+
+class PostStats(Rollup):
+    """Posts per day, user and status (refresh: artisan rollup:refresh)"""
+    
+    table = "post_stats"
+    source = "posts"
+    
+    dimensions = {
+        "day": "DATE(created_at)",
+        "user_id": "user_id",
+        "status": "COALESCE(status, 'draft')",
+    }
+    
+    measures = {
+        "posts": "COUNT(*)",
+    }
+    
+    time_column = "created_at"
+    time_dimension = "day"
+    
+    @classmethod
+    async def per_status(cls):
+        """Site-wide post count per status"""
+        return await cls.aggregate(['status'], order_by='status')
+    
+    @classmethod
+    async def per_day(cls, days: int = 30):
+        """Site-wide post count for the latest days"""
+        return await cls.aggregate(['day'], order_by='day DESC', limit=days)
+    
+    @classmethod
+    async def per_user(cls, limit: int = 10):
+        """Most active authors"""
+        return await cls.aggregate(['user_id'], order_by='posts DESC', limit=limit)
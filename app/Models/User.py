@@ -22,6 +22,13 @@ class User(Model):
     
     hidden = ["password"]
     
+    # Looked up on every authenticated request; kept fresh across
+    # instances by the invalidation bus
+    cache_ttl = 60
+    
+    # Users (and, through Post.shard_key, their posts) are spread across DB_SHARDS
+    shard_key = "id"
+    
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
     
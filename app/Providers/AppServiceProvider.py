@@ -1,12 +1,42 @@
 from app.Http.Middleware.MethodOverrideMiddleware import MethodOverrideMiddleware
-from app.Http.Middleware.AuthMiddleware import AuthMiddleware
+from app.Http.Middleware.CompressionMiddleware import CompressionMiddleware
+from config.app import (
+    COMPRESSION_ENABLED, COMPRESSION_MIN_SIZE, COMPRESSION_GZIP_LEVEL, COMPRESSION_BROTLI_QUALITY,
+    DEFER_WORKERS, DEFER_RETRIES
+)
+from vendor.Illuminate.Database.WriteBehindCounter import WriteBehindCounter
+from vendor.Illuminate.Database.ConnectionPool import ConnectionPool
+from vendor.Illuminate.Database.Invalidation import Invalidation
+from vendor.Illuminate.Database.QueryLog import QueryLog
+from vendor.Illuminate.Support.Deferred import Deferred
 
 class AppServiceProvider:
     def register(self, app):
         print("🔧 AppServiceProvider registered")
         # Register middleware
         app.add_middleware(MethodOverrideMiddleware)
-        app.add_middleware(AuthMiddleware)
+        # Added last = outermost, so it compresses the final response body
+        if COMPRESSION_ENABLED:
+            app.add_middleware(
+                CompressionMiddleware,
+                min_size=COMPRESSION_MIN_SIZE,
+                gzip_level=COMPRESSION_GZIP_LEVEL,
+                brotli_quality=COMPRESSION_BROTLI_QUALITY
+            )
+        
+        # Finish Controller.defer jobs first, they may still write to the database
+        Deferred.configure(workers=DEFER_WORKERS, retries=DEFER_RETRIES)
+        app.add_event_handler("shutdown", Deferred.drain)
+        
+        # Flush buffered counters (e.g. post views) before the worker exits
+        app.add_event_handler("shutdown", WriteBehindCounter.flush_all)
+        app.add_event_handler("shutdown", ConnectionPool.close_all)
+        # Persist query shape counts recorded since the last flush (DB_QUERY_LOG)
+        app.add_event_handler("shutdown", QueryLog.flush)
+        
+        # Evict cached rows (User.cache_ttl) when other instances write them
+        app.add_event_handler("startup", Invalidation.listen)
+        app.add_event_handler("shutdown", Invalidation.stop)
 
     def boot(self, app):
         print("🚀 AppServiceProvider booted")
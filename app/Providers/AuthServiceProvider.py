@@ -1,6 +1,12 @@
+from app.Http.Middleware.AuthMiddleware import auth_user, signed_in
+from vendor.Illuminate.View.View import View
+
 class AuthServiceProvider:
     def register(self, app):
         print("🔑 AuthServiceProvider registered")
+        # Navbar helpers; the token is decoded at most once per request (see layouts/app.html)
+        View.share('auth_user', auth_user)
+        View.share('signed_in', signed_in)
 
     def boot(self, app):
         print("🔐 AuthServiceProvider booted")
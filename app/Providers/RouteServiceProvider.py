@@ -1,15 +1,37 @@
-from routes.web import register_routes
+from app.Http.Kernel import Kernel
+from config.app import ROUTE_DISPATCHER, MAX_CONCURRENT_REQUESTS, REQUEST_QUEUE_SIZE, REQUEST_QUEUE_TIMEOUT
 
 class RouteServiceProvider:
     def register(self, app):
         print("🚏 RouteServiceProvider registered")
         
-        # Register routes
-        register_routes()
-        
-        # Use improved router
+        # Middleware aliases must exist before routes compile their pipelines
         from vendor.Illuminate.Routing.ImprovedRouter import Route
-        app.include_router(Route.router)
+        for name, middleware in Kernel.route_middleware.items():
+            Route.alias_middleware(name, middleware)
+        
+        # Global admission control (per-route limits: .concurrency(n) in routes/web.py)
+        Route.concurrency_limit(MAX_CONCURRENT_REQUESTS, REQUEST_QUEUE_SIZE, REQUEST_QUEUE_TIMEOUT)
+        
+        # Register routes (from bootstrap/cache/routes.py after `artisan route:cache`,
+        # which defers importing controllers until their route is hit)
+        if Route.load_cache():
+            print("   ⚡ Loaded routes from cache")
+        else:
+            from routes.web import register_routes
+            register_routes()
+        
+        # Use improved router (radix: one trie lookup instead of a regex per route)
+        if ROUTE_DISPATCHER == 'radix':
+            app.router.routes.insert(0, Route.radix())
+            print("   🌲 Radix route dispatcher enabled")
+        else:
+            app.include_router(Route.router)
+        
+        # {{ route('posts.show', post_id=post.id) }} and route_many(...) in templates
+        from vendor.Illuminate.View.View import View
+        View.share('route', Route.url)
+        View.share('route_many', Route.url_many)
         
         print(f"   ✅ Registered {len(Route._named_routes)} named routes")
         print(f"   ✅ Applied middleware to {len(Route._middleware_stack)} routes")
@@ -1,5 +1,6 @@
 from jinja2 import Environment, FileSystemLoader
 from vendor.Illuminate.Support.Facades.Facade import Facade
+from vendor.Illuminate.View.View import View
 
 class ViewServiceProvider:
     def register(self, app):
@@ -7,6 +8,8 @@ class ViewServiceProvider:
             loader=FileSystemLoader("resources/views"),
             autoescape=True
         )
+        # Helpers shared with View (route(), route_many())
+        env.globals.update(View.shared())
 
         class ViewManager:
             def make(self, template, context=None):
@@ -1,6 +1,6 @@
 import typer
 import subprocess
-from vendor.Illuminate.Console import generators, database
+from vendor.Illuminate.Console import generators, database, routing, assets
 
 app = typer.Typer(help="✨ Laravel-like Artisan CLI for FastAPI")
 
@@ -56,6 +56,127 @@ def db_seed():
 def migrate_fresh(seed: bool = typer.Option(False, "--seed")):
     database.fresh_migrate(seed)
 
+@app.command("db:dump")
+def db_dump(
+    path: str = typer.Argument(None, help="Archive directory (default: storage/dumps/<database>-<timestamp>)"),
+    jobs: int = typer.Option(4, "--jobs", "-j", help="Tables dumped in parallel"),
+    shard: str = typer.Option(None, "--shard", help="Dump this shard (DB_SHARDS) instead of the main database")
+):
+    """Dump every table (binary COPY on PostgreSQL) into a compressed, chunked archive."""
+    database.dump_database(path, jobs, shard)
+
+@app.command("db:restore")
+def db_restore(
+    path: str = typer.Argument(..., help="Archive directory written by db:dump"),
+    jobs: int = typer.Option(4, "--jobs", "-j", help="Tables loaded in parallel"),
+    shard: str = typer.Option(None, "--shard", help="Restore into this shard (DB_SHARDS)"),
+    force: bool = typer.Option(False, "--force", help="Do not ask for confirmation")
+):
+    """Replace the database's rows with a db:dump archive (indexes rebuilt after the load)."""
+    if not force and not typer.confirm("⚠️  This replaces all rows of the dumped tables. Continue?"):
+        raise typer.Abort()
+    database.restore_database(path, jobs, shard)
+
+@app.command("db:advise")
+def db_advise(
+    log: str = typer.Option(None, "--log", help="Query log recorded with DB_QUERY_LOG"),
+    no_migration: bool = typer.Option(False, "--no-migration", help="Only print the advice")
+):
+    """Suggest composite indexes for recorded QueryBuilder queries."""
+    database.advise(log, write=not no_migration)
+
+@app.command("db:recount")
+def db_recount(batch: int = typer.Option(1000, "--batch", help="Parent rows per transaction")):
+    """Rebuild counter cache columns (Model.counter_caches)."""
+    database.recount(batch)
+
+@app.command("rollup:refresh")
+def rollup_refresh(
+    name: str = typer.Argument(None, help="Rollup class or table (default: all)"),
+    since: int = typer.Option(None, "--since", help="Only rebuild the last N days (table rollups)"),
+    every: int = typer.Option(0, "--every", help="Keep running, refreshing every N seconds")
+):
+    """Refresh summary tables (materialized views on PostgreSQL)."""
+    import time
+    while True:
+        database.refresh_rollups(name, since)
+        if not every:
+            break
+        time.sleep(every)
+
+@app.command("partition:maintain")
+def partition_maintain(
+    retain: int = typer.Option(None, "--retain", help="Intervals to keep (default: model's retain)"),
+    archive: bool = typer.Option(False, "--archive", help="Move expired partitions to the archive schema"),
+    drop: bool = typer.Option(False, "--drop", help="Drop expired partitions")
+):
+    """Create upcoming partitions and detach expired ones (Model.partitioning)."""
+    mode = "drop" if drop else "archive" if archive else "detach"
+    database.maintain_partitions(retain, mode)
+
+@app.command("shard:rebalance")
+def shard_rebalance(
+    dry_run: bool = typer.Option(False, "--dry-run", help="Only report rows on the wrong shard"),
+    batch: int = typer.Option(500, "--batch", help="Rows per batch")
+):
+    """Move rows of sharded models to the shard owning their key (after changing DB_SHARDS)."""
+    database.rebalance_shards(dry_run, batch)
+
+@app.command("posts:rerender")
+def posts_rerender(
+    batch: int = typer.Option(500, "--batch", help="Posts per transaction"),
+    force: bool = typer.Option(False, "--force", help="Re-render every post, not only outdated ones"),
+    pause: float = typer.Option(0, "--pause", help="Seconds to sleep between batches")
+):
+    """Refresh posts.content_html after the Markdown renderer changed."""
+    database.rerender_posts(batch, force, pause)
+
+@app.command("export:posts")
+def export_posts(
+    format: str = typer.Option("csv", "--format", help="csv or jsonl"),
+    output: str = typer.Option(None, "--output", "-o", help="File to write (default: posts-<timestamp>.<format>)"),
+    gzip: bool = typer.Option(False, "--gzip", help="Gzip the output"),
+    user: int = typer.Option(None, "--user", help="Only posts of this user id"),
+    status: str = typer.Option(None, "--status", help="Only posts with this status")
+):
+    """Export posts to CSV/JSONL without loading them all into memory."""
+    database.export("Post", format, output, gzip, user, status)
+
+@app.command("import:posts")
+def import_posts(
+    path: str = typer.Argument(..., help="CSV or JSONL file"),
+    format: str = typer.Option(None, "--format", help="csv or jsonl (default: from the extension)"),
+    batch: int = typer.Option(500, "--batch", help="Rows per transaction"),
+    user: int = typer.Option(None, "--user", help="Author for records without user_id")
+):
+    """Bulk import posts from CSV/JSONL (validated and inserted in batches)."""
+    database.import_models(path, "Post", format, batch, user)
+
+# -------------------------------
+# Route Commands
+# -------------------------------
+@app.command("route:cache")
+def route_cache():
+    """Cache the route table so boot skips controller imports and route analysis."""
+    routing.route_cache()
+
+@app.command("route:clear")
+def route_clear():
+    """Remove the route cache."""
+    routing.route_clear()
+
+# -------------------------------
+# Asset Commands
+# -------------------------------
+@app.command("assets:compress")
+def assets_compress(
+    directory: str = typer.Option("public/static", "--dir", help="Static files directory"),
+    min_size: int = typer.Option(1024, "--min-size", help="Skip files smaller than this (bytes)"),
+    force: bool = typer.Option(False, "--force", help="Rewrite siblings that are up to date")
+):
+    """Precompress static assets into .gz / .br siblings served by PrecompressedStaticFiles."""
+    assets.compress_assets(directory, min_size, force)
+
 # -------------------------------
 # Serve Command
 # -------------------------------
@@ -0,0 +1,79 @@
+"""
+Benchmark: global BaseHTTPMiddleware auth vs auth resolved by the 'auth' route middleware
+
+Measures in-process throughput (no network) of the real application
+(bootstrap.app.create_app) with a valid auth cookie on every request:
+the WelcomeController page rendered (a fresh query string per request
+bypasses the response cache), the same page served from the response
+cache, and a static file. "before" wraps the app in the
+previous AuthMiddleware (BaseHTTPMiddleware, token decoded on every
+request); "after" is the app as configured, where only routes with
+'auth' decode the token.
+
+Usage:
+    python benchmarks/auth_middleware.py [--requests 2000]
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('SECRET_KEY', 'benchmark-secret-key-0123456789abcdef')
+
+import httpx
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from bootstrap.app import create_app
+from vendor.Illuminate.Auth.JWT import JWT
+
+STATIC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'public', 'static')
+
+
+class EagerAuthMiddleware(BaseHTTPMiddleware):
+    """The previous implementation: decode the token on every request"""
+
+    async def dispatch(self, request, call_next):
+        token = request.cookies.get('auth_token')
+        if not token:
+            token = JWT.extract_from_header(request.headers.get('Authorization'))
+        payload = JWT.decode(token) if token else None
+        request.state.user = payload
+        request.state.authenticated = payload is not None
+        return await call_next(request)
+
+
+async def measure(app, path: str, requests: int, cookies) -> float:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url='http://bench', cookies=cookies) as client:
+        for i in range(50):
+            await client.get(path.format(i=-i))
+        started = time.perf_counter()
+        for i in range(requests):
+            response = await client.get(path.format(i=i))
+            assert response.status_code == 200, response.status_code
+        return requests / (time.perf_counter() - started)
+
+
+async def main(requests: int):
+    app = create_app()
+    cookies = {'auth_token': JWT.generate(1, 'bench@example.com')}
+    static_file = sorted(os.listdir(STATIC_DIR))[0]
+    pages = (
+        ('welcome (rendered)', '/?n={i}'),
+        ('welcome (cached)', '/'),
+        (f'static {static_file}', f'/static/{static_file}'),
+    )
+
+    print(f"\n{'':24}{'before':>12}{'after':>12}{'speedup':>10}")
+    for label, path in pages:
+        before = await measure(EagerAuthMiddleware(app), path, requests, cookies)
+        after = await measure(app, path, requests, cookies)
+        print(f"{label:24}{before:>9.0f}r/s{after:>9.0f}r/s{after / before:>9.2f}x")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--requests', type=int, default=2000)
+    asyncio.run(main(parser.parse_args().requests))
@@ -0,0 +1,112 @@
+"""
+Benchmark: FastAPI regex routing vs RadixRouter
+
+Builds 10, 100 and 1,000 resource-style routes (index, create, store,
+show, edit, update, destroy per resource) and measures, for the last
+registered resource (the worst case for in-order matching):
+  - route matching alone (Router.matches over app.router.routes)
+  - in-process request throughput (httpx ASGITransport, no network)
+
+Usage:
+    python benchmarks/route_dispatch.py [--requests 2000] [--lookups 20000]
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx
+from fastapi import FastAPI, Request
+from starlette.responses import PlainTextResponse
+from starlette.routing import Match
+
+from vendor.Illuminate.Routing.RadixRouter import RadixRouter
+
+ACTIONS = [
+    ('GET', ''), ('GET', '/create'), ('POST', ''),
+    ('GET', '/{id}'), ('GET', '/{id}/edit'), ('PUT', '/{id}'), ('DELETE', '/{id}'),
+]
+
+
+def route_table(count: int):
+    routes = []
+    for resource in range(count // len(ACTIONS) + 1):
+        for method, suffix in ACTIONS:
+            routes.append((method, f"/resource{resource}{suffix}"))
+    return routes[:count]
+
+
+def make_endpoint(path: str):
+    async def route_handler(request: Request):
+        return PlainTextResponse(path)
+    return route_handler
+
+
+def make_regex_app(routes) -> FastAPI:
+    app = FastAPI()
+    for method, path in routes:
+        app.router.add_api_route(path, make_endpoint(path), methods=[method])
+    return app
+
+
+def make_radix_app(routes) -> FastAPI:
+    app = FastAPI()
+    radix = RadixRouter()
+    for method, path in routes:
+        radix.add(method, path, make_endpoint(path))
+    app.router.routes.insert(0, radix)
+    return app
+
+
+def target(routes) -> str:
+    last = [path for method, path in routes if method == 'GET'][-1]
+    return last.replace('{id}', '42')
+
+
+def match_time(app, path: str, lookups: int) -> float:
+    """Microseconds to find the matching route, as Router.app does"""
+    scope = {'type': 'http', 'method': 'GET', 'path': path, 'root_path': '', 'path_params': {}}
+    started = time.perf_counter()
+    for _ in range(lookups):
+        for route in app.router.routes:
+            if route.matches(scope)[0] == Match.FULL:
+                break
+    return (time.perf_counter() - started) / lookups * 1e6
+
+
+async def throughput(app, path: str, requests: int) -> float:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url='http://bench') as client:
+        for _ in range(50):
+            await client.get(path)
+        started = time.perf_counter()
+        for _ in range(requests):
+            response = await client.get(path)
+            assert response.status_code == 200, response.status_code
+        return requests / (time.perf_counter() - started)
+
+
+async def main(requests: int, lookups: int):
+    print(f"{'routes':>8}{'match regex':>14}{'match radix':>14}{'speedup':>10}"
+          f"{'regex':>12}{'radix':>12}{'speedup':>10}")
+    for count in (10, 100, 1000):
+        routes = route_table(count)
+        path = target(routes)
+        regex, radix = make_regex_app(routes), make_radix_app(routes)
+
+        regex_match, radix_match = match_time(regex, path, lookups), match_time(radix, path, lookups)
+        regex_rps = await throughput(regex, path, requests)
+        radix_rps = await throughput(radix, path, requests)
+        print(f"{count:>8}{regex_match:>12.1f}us{radix_match:>12.1f}us{regex_match / radix_match:>9.1f}x"
+              f"{regex_rps:>9.0f}r/s{radix_rps:>9.0f}r/s{radix_rps / regex_rps:>9.2f}x")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--lookups', type=int, default=20000)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.lookups))
@@ -1,6 +1,6 @@
 from fastapi import FastAPI
 from bootstrap.providers import register_providers
-from fastapi.staticfiles import StaticFiles
+from vendor.Illuminate.Filesystem.PrecompressedStaticFiles import PrecompressedStaticFiles
 import os
 
 def create_app():
@@ -28,7 +28,8 @@ def create_app():
             break
 
     if static_dir:
-        app.mount("/static", StaticFiles(directory=static_dir), name="static")
+        # Serves app.css.br / app.css.gz when present (python artisan.py assets:compress)
+        app.mount("/static", PrecompressedStaticFiles(directory=static_dir), name="static")
 
     return app
 
@@ -4,3 +4,22 @@ APP_NAME = os.getenv("APP_NAME", "LaravelFastAPI")
 APP_ENV = os.getenv("APP_ENV", "local")
 APP_DEBUG = os.getenv("APP_DEBUG", "false").lower() == "true"
 APP_PORT = int(os.getenv("APP_PORT", "8000"))
+
+# Route matching: "regex" (FastAPI, tries routes in order) or "radix" (segment trie)
+ROUTE_DISPATCHER = os.getenv("ROUTE_DISPATCHER", "regex").lower()
+
+# Admission control: requests running at once across all routes (0 = unlimited),
+# how many more may queue, and how long (seconds) they wait before a 503
+MAX_CONCURRENT_REQUESTS = int(os.getenv("MAX_CONCURRENT_REQUESTS", "0"))
+REQUEST_QUEUE_SIZE = int(os.getenv("REQUEST_QUEUE_SIZE", "100"))
+REQUEST_QUEUE_TIMEOUT = float(os.getenv("REQUEST_QUEUE_TIMEOUT", "5"))
+
+# Response compression (CompressionMiddleware): gzip, plus brotli when installed
+COMPRESSION_ENABLED = os.getenv("COMPRESSION_ENABLED", "true").lower() == "true"
+COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", "1024"))
+COMPRESSION_GZIP_LEVEL = int(os.getenv("COMPRESSION_GZIP_LEVEL", "6"))
+COMPRESSION_BROTLI_QUALITY = int(os.getenv("COMPRESSION_BROTLI_QUALITY", "4"))
+
+# Controller.defer: post-response jobs (thread pool size, retries on failure)
+DEFER_WORKERS = int(os.getenv("DEFER_WORKERS", "4"))
+DEFER_RETRIES = int(os.getenv("DEFER_RETRIES", "3"))
@@ -37,3 +37,20 @@ def get_engine():
     """
     db_url = get_database_url()
     return create_engine(db_url)
+
+def get_shard_urls():
+    """
+    Shard databases for sharded models (Model.shard_key), keyed by name.
+
+    DB_SHARDS is a comma-separated list of `name=url` (or bare urls, named
+    shard0, shard1, ...). Empty means no sharding: every model lives in the
+    main database, which always allocates ids for sharded tables.
+    """
+    shards = {}
+    entries = [entry.strip() for entry in os.getenv("DB_SHARDS", "").split(",") if entry.strip()]
+    for index, entry in enumerate(entries):
+        name, sep, url = entry.partition("=")
+        if not sep or "://" in name:
+            name, url = f"shard{index}", entry
+        shards[name.strip()] = url.strip()
+    return shards
@@ -0,0 +1,28 @@
+"""
+Migration: add_post_counters_to_users_table
+"""
+from vendor.Illuminate.Database.Migration import Migration
+
+
+class AddPostCountersToUsersTable(Migration):
+    """Counter cache columns maintained by Post (see Post.counter_caches)"""
+    
+    def up(self):
+        """Run the migrations"""
+        self.execute("ALTER TABLE users ADD COLUMN IF NOT EXISTS posts_count INTEGER NOT NULL DEFAULT 0")
+        self.execute("ALTER TABLE users ADD COLUMN IF NOT EXISTS published_posts_count INTEGER NOT NULL DEFAULT 0")
+        self.execute("ALTER TABLE users ADD COLUMN IF NOT EXISTS draft_posts_count INTEGER NOT NULL DEFAULT 0")
+        
+        # Backfill from existing posts
+        self.execute("""
+        UPDATE users SET
+            posts_count = (SELECT COUNT(*) FROM posts WHERE posts.user_id = users.id),
+            published_posts_count = (SELECT COUNT(*) FROM posts WHERE posts.user_id = users.id AND posts.status = 'published'),
+            draft_posts_count = (SELECT COUNT(*) FROM posts WHERE posts.user_id = users.id AND posts.status = 'draft')
+        """)
+    
+    def down(self):
+        """Reverse the migrations"""
+        self.execute("ALTER TABLE users DROP COLUMN IF EXISTS posts_count")
+        self.execute("ALTER TABLE users DROP COLUMN IF EXISTS published_posts_count")
+        self.execute("ALTER TABLE users DROP COLUMN IF EXISTS draft_posts_count")
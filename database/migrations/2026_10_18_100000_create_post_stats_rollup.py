@@ -0,0 +1,17 @@
+"""
+Migration: create_post_stats_rollup
+"""
+from vendor.Illuminate.Database.Migration import Migration
+from app.Models.PostStats import PostStats
+
+
+class CreatePostStatsRollup(Migration):
+    """Summary table for dashboard and admin statistics"""
+    
+    def up(self):
+        """Run the migrations"""
+        self.create_rollup(PostStats)
+    
+    def down(self):
+        """Reverse the migrations"""
+        self.drop_rollup(PostStats)
@@ -0,0 +1,16 @@
+"""
+Migration: add_views_to_posts_table
+"""
+from vendor.Illuminate.Database.Migration import Migration
+
+
+class AddViewsToPostsTable(Migration):
+    """Post view counter (written in batches by Post.view_counter)"""
+    
+    def up(self):
+        """Run the migrations"""
+        self.execute("ALTER TABLE posts ADD COLUMN IF NOT EXISTS views BIGINT NOT NULL DEFAULT 0")
+    
+    def down(self):
+        """Reverse the migrations"""
+        self.execute("ALTER TABLE posts DROP COLUMN IF EXISTS views")
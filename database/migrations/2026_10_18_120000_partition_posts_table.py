@@ -0,0 +1,29 @@
+"""
+Migration: partition_posts_table
+"""
+from vendor.Illuminate.Database.Migration import Migration
+from app.Models.Post import Post
+from app.Models.PostStats import PostStats
+
+
+class PartitionPostsTable(Migration):
+    """
+    Range-partition posts by created_at (monthly, see Post.partitioning)
+    
+    The primary key becomes (id, created_at) and slug uniqueness
+    (slug, created_at); Post.create_post still allocates unique slugs.
+    """
+    
+    def up(self):
+        """Run the migrations"""
+        # The rollup's materialized view depends on posts
+        self.drop_rollup(PostStats)
+        self.partition_table(Post)
+        self.create_rollup(PostStats)
+    
+    def down(self):
+        """Reverse the migrations"""
+        raise RuntimeError(
+            "partition_posts_table cannot be rolled back: posts stays partitioned. "
+            "Restore a dump taken before the migration (db:restore) to undo it."
+        )
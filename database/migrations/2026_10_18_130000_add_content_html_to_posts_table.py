@@ -0,0 +1,23 @@
+"""
+Migration: add_content_html_to_posts_table
+"""
+from vendor.Illuminate.Database.Migration import Migration
+
+
+class AddContentHtmlToPostsTable(Migration):
+    """
+    Rendered Markdown cache for posts
+    
+    Existing rows are filled in by `python artisan.py posts:rerender`;
+    until then views fall back to the raw content.
+    """
+    
+    def up(self):
+        """Run the migrations"""
+        self.execute("ALTER TABLE posts ADD COLUMN IF NOT EXISTS content_html TEXT")
+        self.execute("ALTER TABLE posts ADD COLUMN IF NOT EXISTS content_html_version INTEGER")
+    
+    def down(self):
+        """Reverse the migrations"""
+        self.execute("ALTER TABLE posts DROP COLUMN IF EXISTS content_html_version")
+        self.execute("ALTER TABLE posts DROP COLUMN IF EXISTS content_html")
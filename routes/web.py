@@ -18,16 +18,16 @@ def register_routes():
     # =====================================
     # Public Routes
     # =====================================
-    Route.get('/', WelcomeController, 'index').name('home')
+    Route.get('/', WelcomeController, 'index').name('home').cache(ttl=300, vary=['cookie'])
     Route.get('/test', TestController, 'index').name('test')
     Route.get('/coba', TestController, 'coba').name('coba')
 
     # =====================================
     # Authentication Routes
     # =====================================
-    Route.get('/login', AuthController, 'show_login').name('login')
+    Route.get('/login', AuthController, 'show_login').name('login').cache(ttl=300, vary=['cookie'])
     Route.post('/login', AuthController, 'login')
-    Route.get('/register', AuthController, 'show_register').name('register')
+    Route.get('/register', AuthController, 'show_register').name('register').cache(ttl=300, vary=['cookie'])
     Route.post('/register', AuthController, 'register')
     Route.get('/logout', AuthController, 'logout').name('logout')
 
@@ -43,18 +43,22 @@ def register_routes():
 
         # Posts Management
         Route.prefix('posts').name('posts.').group(lambda: [
-            Route.get('/', PostController, 'index').name('index'),
+            Route.get('/', PostController, 'index').name('index')
+                .cache(ttl=30, vary=['cookie', 'accept'], private=True, depends=['posts']),
             Route.get('/create', PostController, 'create').name('create'),
-            Route.post('/', PostController, 'store').name('store'),
+            Route.post('/', PostController, 'store').name('store').concurrency(8, queue=16, timeout=2.0),
+            Route.get('/export', PostController, 'export').name('export'),
+            Route.post('/import', PostController, 'import_posts').name('import').concurrency(2, queue=2, timeout=1.0),
+            Route.get('/{post_id}', PostController, 'show').name('show'),
             Route.get('/{post_id}/edit', PostController, 'edit').name('edit'),
-            Route.post('/{post_id}', PostController, 'update').name('update'),
+            Route.post('/{post_id}', PostController, 'update').name('update').concurrency(8, queue=16, timeout=2.0),
             Route.post('/{post_id}/delete', PostController, 'destroy').name('destroy'),
         ]),
 
         # Storage Management
         Route.prefix('storage').name('storage.').group(lambda: [
             Route.get('/', StorageController, 'index').name('index'),
-            Route.post('/upload', StorageController, 'upload').name('upload'),
+            Route.post('/upload', StorageController, 'upload').name('upload').concurrency(4, queue=8, timeout=2.0),
             Route.delete('/delete/{path}', StorageController, 'delete').name('delete'),
         ]),
     ])
@@ -65,9 +69,10 @@ def register_routes():
     # =====================================
     # Admin Routes (Auth + Admin)
     # =====================================
-    # Route.prefix('admin').middleware(['auth', 'admin']).name('admin.').group(lambda: [
-    #     # Add admin routes here when needed
-    # ])
+    Route.prefix('admin').middleware(['auth', 'admin']).name('admin.').group(lambda: [
+        # In-flight / queue depth / rejections of the admission limiters
+        Route.get('/metrics/admission', DashboardController, 'admission').name('metrics.admission'),
+    ])
 
 
 def route(name: str, params: dict = None) -> str:
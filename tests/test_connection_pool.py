@@ -0,0 +1,77 @@
+import asyncio
+import threading
+import time
+import unittest
+from unittest import mock
+
+import psycopg2
+import psycopg2.pool
+
+from vendor.Illuminate.Database.ConnectionPool import Pool
+
+
+class FakeConnection:
+    closed = 0
+
+    def close(self):
+        self.closed = 1
+
+    def rollback(self):
+        pass
+
+
+class ConnectionPoolTest(unittest.TestCase):
+
+    def setUp(self):
+        patcher = mock.patch.object(psycopg2, 'connect', lambda dsn: FakeConnection())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_waiting_thread_gets_released_connection(self):
+        pool = Pool('postgresql://test', max_size=1, max_overflow=0, timeout=5)
+        held = pool.getconn()
+        got = []
+
+        waiter = threading.Thread(target=lambda: got.append(pool.getconn()))
+        waiter.start()
+        time.sleep(0.1)
+        self.assertEqual(got, [])
+
+        pool.putconn(held)
+        waiter.join(2)
+        self.assertEqual(got, [held])
+        self.assertEqual(pool.opened, 1)
+
+    def test_waiting_coroutine_gets_released_connection(self):
+        pool = Pool('postgresql://test', max_size=1, max_overflow=1, timeout=5)
+
+        async def scenario():
+            first, overflow = await pool.aget(), await pool.aget()
+            waiter = asyncio.ensure_future(pool.aget())
+            await asyncio.sleep(0.05)
+            self.assertFalse(waiter.done())
+
+            pool.putconn(overflow)
+            self.assertIs(await asyncio.wait_for(waiter, 1), overflow)
+            self.assertFalse(overflow.closed)
+            return first
+
+        asyncio.run(scenario())
+        self.assertEqual(pool.opened, 2)
+
+    def test_exhausted_pool_raises_after_timeout(self):
+        pool = Pool('postgresql://test', max_size=1, max_overflow=0, timeout=0.1)
+        pool.getconn()
+
+        started = time.monotonic()
+        with self.assertRaises(psycopg2.pool.PoolError):
+            pool.getconn()
+        self.assertGreaterEqual(time.monotonic() - started, 0.1)
+
+        with self.assertRaises(psycopg2.pool.PoolError):
+            asyncio.run(pool.aget())
+        self.assertEqual(pool.opened, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()